@@ -22,6 +22,17 @@ def before_all(context):
     context.config.setup_logging()
 
 
+def before_scenario(context, scenario):
+    """ Executed before each scenario """
+    # the driver is shared by all scenarios so reset any browser state
+    context.driver.delete_all_cookies()
+    context.driver.execute_script(
+        "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+    )
+    context.element_cache = {}
+    context.page_text = None
+
+
 def after_all(context):
     """ Executed after all tests """
     context.driver.quit()
@@ -33,8 +44,12 @@ def after_all(context):
 def get_chrome():
     """Creates a headless Chrome driver"""
     options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
-    options.add_argument("--headless")
+    options.add_argument("--disable-dev-shm-usage")
+    # return as soon as the DOM is ready instead of waiting on every asset
+    options.page_load_strategy = "eager"
     return webdriver.Chrome(options=options)
 
 
@@ -42,5 +57,6 @@ def get_firefox():
     """Creates a headless Firefox driver"""
     options = webdriver.FirefoxOptions()
     options.add_argument("--headless")
+    options.page_load_strategy = "eager"
     return webdriver.Firefox(options=options)    
     
\ No newline at end of file
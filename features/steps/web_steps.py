@@ -1,22 +1,83 @@
 import logging
+from contextlib import contextmanager
+from functools import lru_cache
 from behave import when, then
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select, WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
 
 ID_PREFIX = 'product_'
-WAIT_SECONDS = 10  # Consider defining this as a constant
+
+@lru_cache(maxsize=None)
+def _elem_id(element_name):
+    """ Maps a field name from the feature file to its element id """
+    return ID_PREFIX + element_name.lower().replace(' ', '_')
+
+@lru_cache(maxsize=None)
+def _btn_id(button):
+    """ Maps a button name from the feature file to its element id """
+    return button.lower() + '-btn'
 
 def get_element(context, element_name):
-    element_id = ID_PREFIX + element_name.lower().replace(' ', '_')
-    return WebDriverWait(context.driver, WAIT_SECONDS).until(
-        EC.presence_of_element_located((By.ID, element_id))
+    """ Returns the element for element_name, reusing it if already located """
+    element_id = _elem_id(element_name)
+    if element_id in context.element_cache:
+        return context.element_cache[element_id]
+    element = context.driver.find_element(By.ID, element_id)
+    context.element_cache[element_id] = element
+    return element
+
+def set_value(context, element, text):
+    """ Sets an input's value in one script call instead of typing each key """
+    context.driver.execute_script(
+        "arguments[0].value = arguments[1];"
+        "arguments[0].dispatchEvent(new Event('input'));"
+        "arguments[0].dispatchEvent(new Event('change'));",
+        element, text
+    )
+
+def get_value(context, element_name):
+    """ Reads an input's value by id in one script call """
+    return context.driver.execute_script(
+        "return document.getElementById(arguments[0]).value;",
+        _elem_id(element_name)
     )
 
+def select_option(context, element_name, text):
+    """ Selects a dropdown option by its visible text in one script call """
+    return context.driver.execute_script(
+        "var select = document.getElementById(arguments[0]);"
+        "for (var option of select.options) {"
+        "  if (option.text === arguments[1]) {"
+        "    select.value = option.value;"
+        "    select.dispatchEvent(new Event('change'));"
+        "    return true;"
+        "  }"
+        "}"
+        "return false;",
+        _elem_id(element_name), text
+    )
+
+def page_text(context):
+    """ Returns the rendered text of the page, fetched once per page state """
+    if context.page_text is None:
+        context.page_text = context.driver.execute_script("return document.body.innerText;")
+    return context.page_text
+
+@contextmanager
+def no_implicit_wait(context):
+    """ Suspends the session implicit wait so absent elements fail fast """
+    context.driver.implicitly_wait(0)
+    try:
+        yield
+    finally:
+        context.driver.implicitly_wait(context.wait_seconds)
+
 @when('I visit the "Home Page"')
 def step_impl(context):
     """ Navigate to the base URL """
     context.driver.get(context.base_url)
+    context.element_cache.clear()
+    context.page_text = None
     logging.info('Visited the home page')
 
 @then('I should see "{message}" in the title')
@@ -27,23 +88,20 @@ def step_impl(context, message):
 @then('I should not see "{text_string}"')
 def step_impl(context, text_string):
     """ Ensure the specified text is not present on the page """
-    body_text = context.driver.find_element(By.TAG_NAME, 'body').text
-    assert text_string not in body_text, f"Text '{text_string}' should not be present in the body"
+    assert text_string not in page_text(context), f"Text '{text_string}' should not be present in the body"
 
 @when('I set the "{element_name}" to "{text_string}"')
 def step_impl(context, element_name, text_string):
     """ Set the value of the input field identified by element_name """
     element = get_element(context, element_name)
-    element.clear()
-    element.send_keys(text_string)
-    logging.info(f'Set the "{element_name}" field to "{text_string}"')
+    set_value(context, element, text_string)
+    logging.info('Set the "%s" field to "%s"', element_name, text_string)
 
 @when('I select "{text}" in the "{element_name}" dropdown')
 def step_impl(context, text, element_name):
     """ Select an option from a dropdown menu """
-    element = Select(get_element(context, element_name))
-    element.select_by_visible_text(text)
-    logging.info(f'Selected "{text}" in the "{element_name}" dropdown')
+    assert select_option(context, element_name, text), f"No option '{text}' in the '{element_name}' dropdown"
+    logging.info('Selected "%s" in the "%s" dropdown', text, element_name)
 
 @then('I should see "{text}" in the "{element_name}" dropdown')
 def step_impl(context, text, element_name):
@@ -55,63 +113,59 @@ def step_impl(context, text, element_name):
 @then('the "{element_name}" field should be empty')
 def step_impl(context, element_name):
     """ Verify the input field is empty """
-    element = get_element(context, element_name)
-    assert element.get_attribute('value') == '', f"The '{element_name}' field is not empty"
+    assert get_value(context, element_name) == '', f"The '{element_name}' field is not empty"
 
 @when('I copy the "{element_name}" field')
 def step_impl(context, element_name):
     """ Copy the value of an input field to the clipboard """
-    element = get_element(context, element_name)
-    context.clipboard = element.get_attribute('value')
-    logging.info(f'Copied value to clipboard: {context.clipboard}')
+    context.clipboard = get_value(context, element_name)
+    logging.info('Copied value to clipboard: %s', context.clipboard)
 
 @when('I paste the "{element_name}" field')
 def step_impl(context, element_name):
     """ Paste the value from the clipboard into an input field """
     element = get_element(context, element_name)
-    element.clear()
-    element.send_keys(context.clipboard)
-    logging.info(f'Pasted value into "{element_name}" field')
+    set_value(context, element, context.clipboard)
+    logging.info('Pasted value into "%s" field', element_name)
 
 @when('I press the "{button}" button')
 def step_impl(context, button):
     """ Click the button with the specified name """
-    button_id = button.lower() + '-btn'
-    context.driver.find_element(By.ID, button_id).click()
-    logging.info(f'Pressed the "{button}" button')
+    context.driver.find_element(By.ID, _btn_id(button)).click()
+    context.element_cache.clear()
+    context.page_text = None
+    logging.info('Pressed the "%s" button', button)
 
 @then('I should see "{text_string}" in the "{element_name}" field')
 def step_impl(context, text_string, element_name):
     """ Verify that the input field contains the expected text """
-    element = get_element(context, element_name)
-    assert element.get_attribute('value') == text_string, f"Expected '{text_string}' but found '{element.get_attribute('value')}'"
+    actual = get_value(context, element_name)
+    assert actual == text_string, f"Expected '{text_string}' but found '{actual}'"
 
 @when('I change "{element_name}" to "{text_string}"')
 def step_impl(context, element_name, text_string):
     """ Change the value of the input field """
     element = get_element(context, element_name)
-    element.clear()
-    element.send_keys(text_string)
-    logging.info(f'Changed "{element_name}" to "{text_string}"')
+    set_value(context, element, text_string)
+    logging.info('Changed "%s" to "%s"', element_name, text_string)
 
 @then('I should see "{name}" in the results')
 def step_impl(context, name):
     """ Verify the search results contain the specified name """
-    results_element = WebDriverWait(context.driver, WAIT_SECONDS).until(
-        EC.presence_of_element_located((By.ID, 'search_results'))
-    )
+    results_element = context.driver.find_element(By.ID, 'search_results')
     assert name in results_element.text, f"Expected '{name}' to be in the search results"
 
 @then('I should not see "{name}" in the results')
 def step_impl(context, name):
     """ Ensure the search results do not contain the specified name """
-    results_element = context.driver.find_element(By.ID, 'search_results')
-    assert name not in results_element.text, f"Expected '{name}' to not be in the search results"
+    with no_implicit_wait(context):
+        results = context.driver.find_elements(By.ID, 'search_results')
+        if not results:
+            return
+        assert name not in results[0].text, f"Expected '{name}' to not be in the search results"
 
 @then('I should see the message "{message}"')
 def step_impl(context, message):
     """ Verify that a specific message is displayed """
-    flash_message_element = WebDriverWait(context.driver, WAIT_SECONDS).until(
-        EC.presence_of_element_located((By.ID, 'flash_message'))
-    )
+    flash_message_element = context.driver.find_element(By.ID, 'flash_message')
     assert message in flash_message_element.text, f"Expected flash message '{message}' but found '{flash_message_element.text}'"
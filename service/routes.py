@@ -87,7 +87,7 @@ def list_products():
         products = Product.all()
 
     results = [product.serialize() for product in products]
-    return jsonify(results), status.HTTP_200_OK
+    return jsonify(results), status.HTTP_200_OK, {"X-Total-Count": str(len(results))}
 
 # R E A D   A   P R O D U C T
 @app.route("/products/<int:product_id>", methods=["GET"])